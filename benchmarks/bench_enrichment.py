@@ -0,0 +1,106 @@
+# benchmarks/bench_enrichment.py
+#
+# Load-tests the API enrichment path against the local mock product server:
+# - catalog fetch time, request count and retries (cold cache)
+# - the same fetch again with the in-process catalog cache (warm)
+# - enrichment throughput and match rate over synthetic transactions
+#
+# Usage:
+#   python benchmarks/bench_enrichment.py --catalog-size 5000 --latency 0.02 \
+#       --error-rate 0.1 --rate-limit 50 --transactions 200000
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import api_handler
+from utils.mock_product_api import start_mock_server
+
+
+def make_transactions(n, catalog_size, miss_rate, seed=42):
+    """
+    Synthetic transactions; about miss_rate of them reference unknown products
+    """
+    rng = random.Random(seed)
+    max_id = int(catalog_size / (1 - miss_rate)) if miss_rate < 1 else catalog_size * 2
+    return [
+        {
+            "TransactionID": f"T{i}",
+            "Date": "2024-12-01",
+            "ProductID": f"P{rng.randint(1, max_id)}",
+            "ProductName": "Item",
+            "Quantity": rng.randint(1, 10),
+            "UnitPrice": 100.0,
+            "CustomerID": f"C{rng.randint(1, 1000)}",
+            "Region": "North",
+        }
+        for i in range(n)
+    ]
+
+
+def timed_fetch(base_url, args, use_cache):
+    api_handler.reset_fetch_stats()
+    start = time.perf_counter()
+    products = api_handler.fetch_all_products(
+        base_url=base_url, limit=args.page_size, retries=args.retries,
+        backoff=args.backoff, use_cache=use_cache,
+    )
+    return products, time.perf_counter() - start, dict(api_handler.FETCH_STATS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Enrichment benchmark against the mock product API")
+    parser.add_argument("--catalog-size", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--retries", type=int, default=5)
+    parser.add_argument("--backoff", type=float, default=0.05)
+    parser.add_argument("--transactions", type=int, default=100000)
+    parser.add_argument("--miss-rate", type=float, default=0.1)
+    args = parser.parse_args()
+
+    server = start_mock_server(
+        catalog_size=args.catalog_size, latency=args.latency,
+        error_rate=args.error_rate, rate_limit=args.rate_limit,
+    )
+
+    try:
+        api_handler.clear_catalog_cache()
+        products, cold_secs, cold_stats = timed_fetch(server.base_url, args, use_cache=True)
+        _, warm_secs, warm_stats = timed_fetch(server.base_url, args, use_cache=True)
+
+        transactions = make_transactions(args.transactions, args.catalog_size, args.miss_rate)
+        mapping = api_handler.create_product_mapping(products)
+
+        start = time.perf_counter()
+        enriched = api_handler.enrich_sales_data(transactions, mapping)
+        enrich_secs = time.perf_counter() - start
+        matched = sum(1 for t in enriched if t["API_Match"])
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("\nENRICHMENT BENCHMARK")
+    print("-" * 55)
+    print(f"Mock server:       {args.catalog_size} products, latency {args.latency}s, "
+          f"error rate {args.error_rate:.0%}, rate limit {args.rate_limit or 'none'}")
+    print(f"Server saw:        {server.stats['requests']} requests, {server.stats['errors']} errors, "
+          f"{server.stats['rate_limited']} rate-limited")
+    print(f"Cold fetch:        {len(products)} products in {cold_secs:.3f}s "
+          f"({cold_stats['requests']} requests, {cold_stats['retries']} retries, {cold_stats['failures']} failures)")
+    print(f"Warm fetch:        {warm_secs * 1000:.3f} ms (cache hits: {warm_stats['cache_hits']})")
+    rate = (len(enriched) / enrich_secs) if enrich_secs else 0.0
+    print(f"Enrichment:        {len(enriched)} transactions in {enrich_secs:.3f}s ({rate:,.0f} txn/s)")
+    match_pct = (matched / len(enriched) * 100) if enriched else 0.0
+    print(f"Match rate:        {matched}/{len(enriched)} ({match_pct:.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
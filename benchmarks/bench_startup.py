@@ -0,0 +1,116 @@
+# benchmarks/bench_startup.py
+#
+# Measures CLI startup cost:
+# - wall time of short invocations (--cache-info, --help)
+# - wall time of a cache-hit run (main.py --no-prompt with a warm cache),
+#   run in a scratch directory against the local mock product API
+# - heaviest modules pulled in by `import main` (python -X importtime)
+#
+# Usage: python benchmarks/bench_startup.py [runs]
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(PROJECT_ROOT, "main.py")
+
+sys.path.insert(0, PROJECT_ROOT)
+
+COMMANDS = {
+    "python -c pass (baseline)": [sys.executable, "-c", "pass"],
+    "main.py --cache-info": [sys.executable, MAIN, "--cache-info"],
+    "main.py --help": [sys.executable, MAIN, "--help"],
+}
+
+
+def time_command(cmd, runs, cwd=PROJECT_ROOT, env=None):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def time_cache_hit(runs):
+    """
+    Warms the result cache in a scratch directory, then times cache-hit runs
+    Returns (timings, hit) where hit says whether the warm run was cached
+    """
+    from utils.mock_product_api import start_mock_server
+
+    workdir = tempfile.mkdtemp(prefix="bench_startup_")
+    try:
+        os.makedirs(os.path.join(workdir, "data"))
+        shutil.copy(os.path.join(PROJECT_ROOT, "data", "sales_data.txt"), os.path.join(workdir, "data"))
+        env = dict(os.environ, SALES_CACHE_DIR=os.path.join(workdir, ".cache"))
+
+        server = start_mock_server()
+        try:
+            cmd = [sys.executable, MAIN, "--no-prompt", "--api-url", server.base_url]
+            subprocess.run(cmd, cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+            check = subprocess.run(cmd, cwd=workdir, env=env, capture_output=True, text=True, check=False)
+            hit = "Cache hit" in check.stdout
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        # Server is down: any run that isn't a cache hit would show up as an API error
+        return time_command(cmd, runs, cwd=workdir, env=env), hit
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def top_imports(module="main", n=10):
+    """
+    Returns [(cumulative_us, module_name), ...] for the slowest imports
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=False,
+    )
+
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        try:
+            _, cumulative_us, name = line[len("import time:"):].split("|")
+            rows.append((int(cumulative_us), name.rstrip()))
+        except ValueError:
+            continue
+
+    rows.sort(reverse=True)
+    return rows[:n]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    print(f"Startup wall time ({runs} runs)")
+    print("-" * 55)
+    print(f"{'Command':<34}{'Median ms':>12}{'Min ms':>12}")
+    for label, cmd in COMMANDS.items():
+        timings = time_command(cmd, runs)
+        print(f"{label:<34}{statistics.median(timings):>12.1f}{min(timings):>12.1f}")
+
+    timings, hit = time_cache_hit(runs)
+    label = "main.py --no-prompt (cache hit)"
+    print(f"{label:<34}{statistics.median(timings):>12.1f}{min(timings):>12.1f}")
+    if not hit:
+        print("  warning: cache was not warmed, this timed full runs")
+
+    print("\nSlowest imports for `import main`")
+    print("-" * 55)
+    for cumulative_us, name in top_imports():
+        print(f"{cumulative_us / 1000:>8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,47 +1,169 @@
 # main.py
 
-from utils.file_handler import read_sales_data
-from utils.data_processor import (
-    parse_transactions,
-    validate_and_filter,
-    calculate_total_revenue,
-    region_wise_sales,
-    top_selling_products,
-    customer_analysis,
-    daily_sales_trend,
-    low_performing_products,
-)
-from utils.api_handler import (
-    fetch_all_products,
-    create_product_mapping,
-    enrich_sales_data,
-    save_enriched_data,
+import argparse
+import os
+import time
+
+# Only what a cached run needs is imported up front. The processing,
+# API (requests) and report modules are imported at the step that uses
+# them, so --cache-info / cache hits start fast.
+from utils.file_handler import expand_input_paths
+from utils.result_cache import (
+    catalog_version,
+    catalog_is_fresh,
+    make_cache_key,
+    load_cached_result,
+    save_cached_result,
+    cache_info,
+    clear_cache,
 )
-from utils.report_generator import generate_sales_report
+
+
+DATA_FILE = "data/sales_data.txt"
+ENRICHED_FILE = "data/enriched_sales_data.txt"
+REPORT_FILE = "output/sales_report.txt"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Sales Analytics System")
+    parser.add_argument("--input", nargs="+", default=[DATA_FILE],
+                        help="Input files, directories or glob patterns (.txt or .txt.gz)")
+    parser.add_argument("--workers", type=int, help="Worker processes for reading input files")
+    parser.add_argument("--region", help="Filter by region (skips interactive prompt)")
+    parser.add_argument("--min-amount", type=float, help="Minimum transaction amount (skips interactive prompt)")
+    parser.add_argument("--max-amount", type=float, help="Maximum transaction amount (skips interactive prompt)")
+    parser.add_argument("--no-prompt", action="store_true", help="Run without interactive filter prompts")
+    parser.add_argument("--trend-period", choices=["auto", "day", "week", "month", "year"], default="auto",
+                        help="Bucketing for the sales trend section of the report")
+    parser.add_argument("--appendix-dir", help="Also write full-detail appendix files to this directory")
+    parser.add_argument("--api-url", help="Product API base URL (default: SALES_API_BASE_URL or DummyJSON)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the result cache")
+    parser.add_argument("--cache-info", action="store_true", help="Show result cache contents and exit")
+    parser.add_argument("--clear-cache", action="store_true", help="Remove all result cache entries and exit")
+    return parser.parse_args()
+
+
+def show_cache_info():
+    info = cache_info()
+    print(f"Cache dir: {info['cache_dir']}")
+    print(f"Entries:   {info['entries']}")
+    print(f"Size:      {info['total_bytes']:,} / {info['max_bytes']:,} bytes")
+    for item in info["items"]:
+        print(f"  {item['key'][:16]}  {item['size']:>10,} B  last used {item['last_used']}")
+
+
+def restore_cached_result(cached):
+    """
+    Writes cached output files back and prints the cached summary
+    """
+    for path, content in cached.get("files", {}).items():
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+    print("\nCache hit - reusing previous results")
+    agg = cached.get("aggregates", {})
+    print(f"Valid: {agg.get('valid_count')} | Invalid: {agg.get('invalid_count')}")
+    print(f"Total Revenue: ₹{agg.get('total_revenue', 0):,.2f}")
+    print(f"Enriched {agg.get('enriched_count')}/{agg.get('total_checked')} transactions")
+    print(f"Saved to: {ENRICHED_FILE}")
+    print(f"Report saved to: {REPORT_FILE}")
+    print("=" * 40)
+
+
+def load_valid_cached_result(cache_key, api_url):
+    """
+    Returns the cached result if its product catalog is still current
+
+    Within CATALOG_TTL the entry is trusted as is. After that the catalog
+    is re-fetched and the entry is only reused if it is unchanged.
+    """
+    cached = load_cached_result(cache_key)
+    if not cached:
+        return None
+    if catalog_is_fresh(cached):
+        return cached
+
+    print("\nCached result is past the catalog TTL - re-checking product catalog...")
+    from utils.api_handler import fetch_all_products
+
+    products = fetch_all_products(base_url=api_url)
+    if products and catalog_version(products) == cached.get("catalog_version"):
+        cached["catalog_fetched_at"] = time.time()
+        save_cached_result(cache_key, cached)
+        return cached
+
+    print("Product catalog changed - recomputing")
+    return None
 
 
 def main():
-   
+    args = parse_args()
+
+    if args.clear_cache:
+        print(f"Removed {clear_cache()} cache entries")
+        return
+    if args.cache_info:
+        show_cache_info()
+        return
+
+    interactive = not (
+        args.no_prompt
+        or args.region is not None
+        or args.min_amount is not None
+        or args.max_amount is not None
+    )
+    use_cache = not args.no_cache
+    report_options = {"trend_period": args.trend_period, "appendix_dir": args.appendix_dir}
+    api_url = args.api_url or os.environ.get("SALES_API_BASE_URL")
+
     try:
         print("=" * 40)
         print("SALES ANALYTICS SYSTEM")
         print("=" * 40)
 
+        # Our own outputs live next to the inputs; never read them back in
+        input_files = expand_input_paths(args.input, exclude=[ENRICHED_FILE, REPORT_FILE])
+        if not input_files:
+            print("No input files found. Please check --input paths.")
+            return
+
+        # Non-interactive runs know their filters up front, so a cache hit
+        # can skip every step including reading the files
+        cache_key = None
+        if use_cache and not interactive:
+            cache_key = make_cache_key(input_files, args.region, args.min_amount, args.max_amount,
+                                       options=report_options, catalog_source=api_url)
+            cached = load_valid_cached_result(cache_key, api_url)
+            if cached:
+                restore_cached_result(cached)
+                return
+
         # -----------------------------
         # [1/10] Read sales data
         # -----------------------------
         print("\n[1/10] Reading sales data...")
-        raw_lines = read_sales_data("data/sales_data.txt")
-        if not raw_lines:
+        from utils.file_handler import read_sales_files
+
+        start = time.perf_counter()
+        transactions, file_stats = read_sales_files(input_files, workers=args.workers)
+        elapsed = time.perf_counter() - start
+
+        total_lines = sum(s["lines"] for s in file_stats if not s["error"])
+        if not total_lines:
             print("No data read. Please check file path or file content.")
             return
-        print(f"Successfully read {len(raw_lines)} raw lines")
+        rejected = sum(1 for s in file_stats if s["error"])
+        rate = (total_lines / elapsed) if elapsed else 0.0
+        print(f"Successfully read {total_lines} raw lines from {len(input_files)} file(s) "
+              f"in {elapsed:.2f}s ({rate:,.0f} lines/s)")
+        if rejected:
+            print(f"Skipped {rejected} file(s) with errors")
 
         # -----------------------------
         # [2/10] Parse & clean
         # -----------------------------
         print("\n[2/10] Parsing and cleaning data...")
-        transactions = parse_transactions(raw_lines)
         if not transactions:
             print("No valid transactions after parsing. Please check file format.")
             return
@@ -63,11 +185,11 @@ def main():
         print("Regions:", ", ".join(regions) if regions else "N/A")
         print(f"Amount Range: ₹{min_amt:,.0f} - ₹{max_amt:,.0f}")
 
-        apply_filter = input("\nDo you want to filter data? (y/n): ").strip().lower()
+        region_filter = args.region
+        min_amount = args.min_amount
+        max_amount = args.max_amount
 
-        region_filter = None
-        min_amount = None
-        max_amount = None
+        apply_filter = input("\nDo you want to filter data? (y/n): ").strip().lower() if interactive else "n"
 
         if apply_filter == "y":
             if regions:
@@ -92,10 +214,20 @@ def main():
                     print("Invalid max amount. Ignoring max filter.")
                     max_amount = None
 
+        if use_cache and cache_key is None:
+            cache_key = make_cache_key(input_files, region_filter, min_amount, max_amount,
+                                       options=report_options, catalog_source=api_url)
+            cached = load_valid_cached_result(cache_key, api_url)
+            if cached:
+                restore_cached_result(cached)
+                return
+
         # -----------------------------
         # [4/10] Validate + apply filter
         # -----------------------------
         print("\n[4/10] Validating transactions...")
+        from utils.data_processor import validate_and_filter
+
         valid_transactions, invalid_count, filter_summary = validate_and_filter(
             transactions,
             region=region_filter,
@@ -115,21 +247,37 @@ def main():
         # [5/10] Analysis (Part 2)
         # -----------------------------
         print("\n[5/10] Analyzing sales data...")
+        from utils.data_processor import (
+            calculate_total_revenue,
+            region_wise_sales,
+            top_selling_products,
+            daily_sales_trend,
+            low_performing_products,
+        )
+        from utils.customer_store import build_customer_store
 
         total_revenue = calculate_total_revenue(valid_transactions)
         region_stats = region_wise_sales(valid_transactions)
         top_products = top_selling_products(valid_transactions, n=5)
-        customers = customer_analysis(valid_transactions)
+        customers = build_customer_store(valid_transactions)
         trend = daily_sales_trend(valid_transactions)
         low_products = low_performing_products(valid_transactions, threshold=10)
 
+        print(f"Customers: {len(customers)} | Repeat purchase rate: {customers.repeat_purchase_rate():.2f}%")
         print("Analysis complete")
 
         # -----------------------------
         # [6/10] Fetch API products
         # -----------------------------
         print("\n[6/10] Fetching product data from API...")
-        api_products = fetch_all_products()
+        from utils.api_handler import (
+            fetch_all_products,
+            create_product_mapping,
+            enrich_sales_data,
+            save_enriched_data,
+        )
+
+        api_products = fetch_all_products(base_url=api_url)
         print(f"Fetched {len(api_products)} products")
 
         # -----------------------------
@@ -148,7 +296,7 @@ def main():
         # [8/10] Save enriched file
         # -----------------------------
         print("\n[8/10] Saving enriched data...")
-        enriched_path = "data/enriched_sales_data.txt"
+        enriched_path = ENRICHED_FILE
         save_enriched_data(enriched_transactions, filename=enriched_path)
         print(f"Saved to: {enriched_path}")
 
@@ -156,13 +304,46 @@ def main():
         # [9/10] Generate report
         # -----------------------------
         print("\n[9/10] Generating report...")
-        report_path = "output/sales_report.txt"
-        generate_sales_report(
+        from utils.report_generator import generate_sales_report
+
+        report_path = REPORT_FILE
+        report_files = generate_sales_report(
             transactions=valid_transactions,
             enriched_transactions=enriched_transactions,
             output_file=report_path,
+            trend_period=args.trend_period,
+            appendix_dir=args.appendix_dir,
         )
         print(f"Report saved to: {report_path}")
+        if args.appendix_dir:
+            print(f"Appendix saved to: {args.appendix_dir}")
+
+        # Don't cache runs where the catalog could not be fetched
+        if use_cache and api_products:
+            files = {}
+            for path in [enriched_path] + report_files:
+                with open(path, "r", encoding="utf-8") as f:
+                    files[path] = f.read()
+
+            save_cached_result(cache_key, {
+                "aggregates": {
+                    "valid_count": len(valid_transactions),
+                    "invalid_count": invalid_count,
+                    "filter_summary": filter_summary,
+                    "total_revenue": total_revenue,
+                    "region_stats": region_stats,
+                    "top_products": top_products,
+                    "top_customers": customers.top_spenders(n=5),
+                    "repeat_purchase_rate": customers.repeat_purchase_rate(),
+                    "daily_trend": trend,
+                    "low_products": low_products,
+                    "enriched_count": enriched_count,
+                    "total_checked": len(enriched_transactions),
+                },
+                "files": files,
+                "catalog_version": catalog_version(api_products),
+                "catalog_fetched_at": time.time(),
+            })
 
         # -----------------------------
         # [10/10] Done
@@ -0,0 +1,54 @@
+import pytest
+
+from utils import api_handler
+from utils.api_handler import fetch_all_products, reset_fetch_stats
+from utils.mock_product_api import start_mock_server
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr(api_handler.time, "sleep", calls.append)
+    reset_fetch_stats()
+    return calls
+
+
+def test_fetches_every_page(sleeps):
+    server = start_mock_server(catalog_size=250)
+    try:
+        products = fetch_all_products(server.base_url, use_cache=False)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert [p["id"] for p in products] == list(range(1, 251))
+    assert api_handler.FETCH_STATS["requests"] == 3
+
+
+def test_retry_after_within_cap_is_honoured(sleeps):
+    # One request per 100 s: the second page is answered 429, Retry-After: 1
+    server = start_mock_server(catalog_size=200, rate_limit=0.01)
+    try:
+        products = fetch_all_products(server.base_url, retries=1, use_cache=False)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert products == []
+    assert sleeps == [1.0]
+    assert api_handler.FETCH_STATS["failures"] == 1
+
+
+def test_retry_after_over_cap_fails_without_waiting(sleeps, monkeypatch):
+    monkeypatch.setattr(api_handler, "MAX_RETRY_DELAY", 0.5)
+    server = start_mock_server(catalog_size=200, rate_limit=0.01)
+    try:
+        products = fetch_all_products(server.base_url, retries=3, use_cache=False)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert products == []
+    assert sleeps == []
+    assert api_handler.FETCH_STATS["failures"] == 1
+    assert api_handler.FETCH_STATS["requests"] == 2
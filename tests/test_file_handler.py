@@ -0,0 +1,38 @@
+import concurrent.futures
+import os
+
+from utils import file_handler
+from utils.file_handler import expand_input_paths, read_sales_files
+
+
+HEADER = "TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region"
+
+
+def write_sales_file(path, n):
+    rows = [f"T{i}|2024-12-01|P1|Item|1|10|C1|North" for i in range(n)]
+    path.write_text("\n".join([HEADER] + rows) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_single_cpu_reads_files_in_process(tmp_path, monkeypatch):
+    paths = [write_sales_file(tmp_path / f"part{i}.txt", 3) for i in range(3)]
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool used with one CPU")
+
+    monkeypatch.setattr(file_handler.os, "cpu_count", lambda: 1)
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", no_pool)
+
+    transactions, file_stats = read_sales_files(paths)
+    assert len(transactions) == 9
+    assert [s["records"] for s in file_stats] == [3, 3, 3]
+
+
+def test_same_file_given_twice_is_read_once(tmp_path, monkeypatch):
+    data = tmp_path / "data"
+    data.mkdir()
+    write_sales_file(data / "sales_data.txt", 1)
+    monkeypatch.chdir(tmp_path)
+
+    paths = expand_input_paths(["data", "./data/sales_data.txt", str(data / "*.txt")])
+    assert paths == [os.path.join("data", "sales_data.txt")]
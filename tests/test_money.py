@@ -0,0 +1,86 @@
+import pytest
+
+from utils.data_processor import (
+    calculate_total_revenue,
+    parse_transactions,
+    region_wise_sales,
+    validate_and_filter,
+)
+from utils.money import parse_paise, to_paise
+
+
+HEADER = "TransactionID|Date|ProductID|ProductName|Quantity|UnitPrice|CustomerID|Region"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1,916", 191600),
+    ("523.5", 52350),
+    ("523.05", 52305),
+    ("99.999", 10000),
+    ("0.005", 1),
+    (" 12 ", 1200),
+    ("-5", -500),
+    ("1e3", 100000),
+])
+def test_parse_paise(text, expected):
+    assert parse_paise(text) == expected
+
+
+@pytest.mark.parametrize("text", ["nan", "inf", "abc", "", "1.2.3"])
+def test_parse_paise_rejects_invalid(text):
+    with pytest.raises(ValueError):
+        parse_paise(text)
+
+
+def test_to_paise_rounds_float_noise():
+    assert to_paise(0.1 + 0.2) == 30
+    assert to_paise(19.99) == 1999
+
+
+def test_parse_transactions_prices_match_parse_paise():
+    prices = ["1,916", "523.5", "99.999", "0.005", " 12 ", "1,916", "523.5", "abc", "nan"]
+    lines = [HEADER] + [f"T{i}|2024-12-01|P1|Item|1,000|{p}|C1|North" for i, p in enumerate(prices)]
+    transactions = parse_transactions(lines)
+
+    assert [t["UnitPricePaise"] for t in transactions] == [parse_paise(p) for p in prices[:7]]
+    assert [t["UnitPrice"] for t in transactions][:2] == [1916.0, 523.5]
+    assert all(t["Quantity"] == 1000 for t in transactions)
+
+
+def test_totals_are_exact_and_order_independent():
+    lines = [HEADER] + [f"T{i}|2024-12-01|P1|Item|1|0.10|C1|North" for i in range(1000)]
+    transactions = parse_transactions(lines)
+
+    assert calculate_total_revenue(transactions) == 100.0
+    assert calculate_total_revenue(transactions[::-1]) == 100.0
+    assert region_wise_sales(transactions)["North"]["total_sales_paise"] == 10000
+
+
+def test_records_without_paise_price_are_accepted():
+    records = [{
+        "TransactionID": "T1", "Date": "2024-12-01", "ProductID": "P1",
+        "ProductName": "Item", "Quantity": 2, "UnitPrice": 10.1,
+        "CustomerID": "C1", "Region": "North",
+    }]
+
+    assert calculate_total_revenue(records) == 20.2
+    assert region_wise_sales(records)["North"]["total_sales"] == 20.2
+
+    valid, invalid, _ = validate_and_filter(records, min_amount=20.2)
+    assert (len(valid), invalid) == (1, 0)
+    assert "UnitPricePaise" not in records[0]
+
+
+@pytest.mark.parametrize("price", [None, "", "MISSING"])
+def test_records_with_missing_or_empty_price_are_invalid(price):
+    record = {
+        "TransactionID": "T1", "Date": "2024-12-01", "ProductID": "P1",
+        "ProductName": "Item", "Quantity": 2, "UnitPrice": price,
+        "CustomerID": "C1", "Region": "North",
+    }
+    if price == "MISSING":
+        del record["UnitPrice"]
+
+    valid, invalid, summary = validate_and_filter([record])
+    assert (valid, invalid) == ([], 1)
+    assert summary["invalid"] == 1
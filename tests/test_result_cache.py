@@ -0,0 +1,125 @@
+import os
+import time
+
+import pytest
+
+import main
+from utils import result_cache
+from utils.result_cache import (
+    catalog_version,
+    load_cached_result,
+    make_cache_key,
+    save_cached_result,
+)
+
+
+PRODUCTS = [
+    {"id": 1, "title": "Phone", "category": "smartphones", "brand": "Apple", "rating": 4.5},
+    {"id": 2, "title": "Laptop", "category": "laptops", "brand": "Dell", "rating": 4.1},
+]
+
+
+@pytest.fixture
+def sales_file(tmp_path):
+    path = tmp_path / "sales.txt"
+    path.write_text("TransactionID|Date\nT1|2024-12-01\n", encoding="utf-8")
+    return str(path)
+
+
+def test_key_is_stable_for_same_run(sales_file):
+    assert make_cache_key(sales_file, region="North") == make_cache_key([sales_file], region="North")
+
+
+@pytest.mark.parametrize("changes", [
+    {"region": "South"},
+    {"min_amount": 100},
+    {"max_amount": 5000},
+    {"options": {"trend_period": "month"}},
+    {"catalog_source": "http://127.0.0.1:8000/products"},
+])
+def test_key_changes_with_filters_and_options(sales_file, changes):
+    base = {"region": "North"}
+    assert make_cache_key(sales_file, **base) != make_cache_key(sales_file, **dict(base, **changes))
+
+
+@pytest.mark.parametrize("use_hash", [False, True])
+def test_key_changes_with_input_content(sales_file, use_hash):
+    before = make_cache_key(sales_file, use_hash=use_hash)
+    with open(sales_file, "a", encoding="utf-8") as f:
+        f.write("T2|2024-12-02\n")
+
+    assert make_cache_key(sales_file, use_hash=use_hash) != before
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    payload = {"data": "x" * 1000}
+
+    for i, key in enumerate(["a", "b"]):
+        save_cached_result(key, payload, cache_dir=cache_dir)
+        os.utime(os.path.join(cache_dir, f"{key}.json"), (1000 + i, 1000 + i))
+
+    # Reading "a" makes "b" the least recently used
+    assert load_cached_result("a", cache_dir=cache_dir) == payload
+    save_cached_result("c", payload, cache_dir=cache_dir, max_bytes=2500)
+
+    assert sorted(os.listdir(cache_dir)) == ["a.json", "c.json"]
+    assert load_cached_result("b", cache_dir=cache_dir) is None
+
+
+def test_catalog_version_ignores_order_and_unused_fields():
+    shuffled = [dict(p, price=99) for p in reversed(PRODUCTS)]
+    assert catalog_version(shuffled) == catalog_version(PRODUCTS)
+    assert catalog_version(PRODUCTS[:1]) != catalog_version(PRODUCTS)
+
+
+#-- main.load_valid_cached_result(): catalog TTL handling
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    monkeypatch.setattr(main, "load_cached_result", lambda key: load_cached_result(key, cache_dir))
+    monkeypatch.setattr(main, "save_cached_result", lambda key, result: save_cached_result(key, result, cache_dir))
+    return cache_dir
+
+
+def store_entry(cache_dir, fetched_at):
+    entry = {"catalog_version": catalog_version(PRODUCTS), "catalog_fetched_at": fetched_at}
+    save_cached_result("k", entry, cache_dir=cache_dir)
+
+
+def patch_catalog(monkeypatch, products):
+    calls = []
+
+    def fetch(base_url=None):
+        calls.append(base_url)
+        return products
+
+    monkeypatch.setattr("utils.api_handler.fetch_all_products", fetch)
+    return calls
+
+
+def test_fresh_entry_is_reused_without_fetching(cache_dir, monkeypatch):
+    store_entry(cache_dir, time.time())
+    calls = patch_catalog(monkeypatch, [])
+
+    assert main.load_valid_cached_result("k", None) is not None
+    assert calls == []
+
+
+def test_stale_entry_is_reused_when_catalog_unchanged(cache_dir, monkeypatch):
+    store_entry(cache_dir, time.time() - result_cache.CATALOG_TTL - 60)
+    calls = patch_catalog(monkeypatch, PRODUCTS)
+
+    cached = main.load_valid_cached_result("k", "http://api")
+    assert cached is not None
+    assert calls == ["http://api"]
+    # Re-check is recorded, so the next run within the TTL skips the fetch
+    assert time.time() - load_cached_result("k", cache_dir)["catalog_fetched_at"] < 60
+
+
+def test_stale_entry_is_dropped_when_catalog_changed(cache_dir, monkeypatch):
+    store_entry(cache_dir, time.time() - result_cache.CATALOG_TTL - 60)
+    patch_catalog(monkeypatch, PRODUCTS[:1])
+
+    assert main.load_valid_cached_result("k", None) is None
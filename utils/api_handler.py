@@ -2,43 +2,145 @@
 
 import os
 import re
+import time
+from email.utils import parsedate_to_datetime
+
 import requests
 
 
-BASE_URL = "https://dummyjson.com/products"
+# Override with SALES_API_BASE_URL (e.g. a local mock server) or base_url=
+BASE_URL = os.environ.get("SALES_API_BASE_URL", "https://dummyjson.com/products")
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Longest single wait between retries, in seconds. A Retry-After above this
+# fails the request instead of stalling the run.
+MAX_RETRY_DELAY = 30.0
+
+# Counters for the last fetch_all_products() calls (used by benchmarks)
+FETCH_STATS = {"requests": 0, "retries": 0, "failures": 0, "cache_hits": 0}
+
+# (base_url, page_size) -> product list
+_catalog_cache = {}
+
+
+def clear_catalog_cache():
+    _catalog_cache.clear()
+
+
+def reset_fetch_stats():
+    for k in FETCH_STATS:
+        FETCH_STATS[k] = 0
+
+
+def _retry_after_seconds(value):
+    """
+    Parses a Retry-After header: delay in seconds or an HTTP-date
+    Returns None if it can't be parsed
+    """
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def _get_with_retry(url, params, retries, backoff):
+    """
+    GET with retries on connection errors and 429/5xx responses
+    Honours Retry-After, otherwise waits backoff * 2**attempt
+    Waits are capped at MAX_RETRY_DELAY; a longer Retry-After raises
+    """
+    for attempt in range(retries + 1):
+        FETCH_STATS["requests"] += 1
+        try:
+            response = requests.get(url, params=params, timeout=10)
+            if response.status_code not in RETRY_STATUS_CODES or attempt == retries:
+                response.raise_for_status()
+                return response
+
+            retry_after = response.headers.get("Retry-After")
+            delay = _retry_after_seconds(retry_after) if retry_after else None
+            if delay is None:
+                delay = min(backoff * (2 ** attempt), MAX_RETRY_DELAY)
+            elif delay > MAX_RETRY_DELAY:
+                response.raise_for_status()
+
+        except requests.exceptions.HTTPError:
+            raise
+        except requests.exceptions.RequestException:
+            if attempt == retries:
+                raise
+            delay = min(backoff * (2 ** attempt), MAX_RETRY_DELAY)
+
+        FETCH_STATS["retries"] += 1
+        time.sleep(delay)
+
 
 #-------------------------- Task 3.1: Fetch Product Details ---------------------#
 
 #-- a) Fetch All Products
-def fetch_all_products():
+def fetch_all_products(base_url=None, limit=100, retries=3, backoff=0.5, use_cache=True):
     """
     Fetches all products from DummyJSON API
 
     Requirements:
-    - Fetch all available products (use limit=100)
+    - Fetch all available products (pages of limit=100, using skip)
     - Handle connection errors with try-except
     - Return empty list if API fails
     - Print status message (success/failure)
+
+    Retries transient errors (see _get_with_retry). Successful catalogs are
+    cached in-process per base_url unless use_cache=False.
+
+    Note: this returns the whole catalog, not just the first limit=100 page
+    as earlier versions did. Product ids above 100 (P101-P110 in the sample
+    data) now get API matches in enrich_sales_data().
     """
-    url = f"{BASE_URL}?limit=100"
+    base_url = base_url or BASE_URL
+    cache_key = (base_url, limit)
+
+    if use_cache and cache_key in _catalog_cache:
+        FETCH_STATS["cache_hits"] += 1
+        products = _catalog_cache[cache_key]
+        print(f" Fetched {len(products)} products from cache")
+        return products
 
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
+        products = []
+        skip = 0
+
+        while True:
+            response = _get_with_retry(base_url, {"limit": limit, "skip": skip}, retries, backoff)
+            data = response.json()
+            page = data.get("products", [])
+            products.extend(page)
+
+            total = data.get("total", len(products))
+            skip += len(page)
+            if not page or skip >= total:
+                break
 
-        data = response.json()
-        products = data.get("products", [])
+        if use_cache:
+            _catalog_cache[cache_key] = products
 
         print(f" Fetched {len(products)} products from API")
         return products
 
     except requests.exceptions.RequestException as e:
+        FETCH_STATS["failures"] += 1
         print(f" API Error: Unable to fetch products ({e})")
         return []
     except ValueError:
+        FETCH_STATS["failures"] += 1
         print(" API Error: Invalid JSON response")
         return []
     except Exception as e:
+        FETCH_STATS["failures"] += 1
         print(f" Unexpected Error in fetch_all_products: {e}")
         return []
 
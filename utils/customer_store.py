@@ -0,0 +1,157 @@
+#---------------------- Customer Analytics Store -----------------------#
+
+from array import array
+from bisect import bisect_left
+from heapq import nlargest
+
+from utils.money import paise_to_rupees, with_paise
+
+
+class _Interner:
+    """
+    Maps string IDs to dense ints (0, 1, 2, ...) and back
+
+    C009 -> 0, C022 -> 1, ...
+    """
+    __slots__ = ("ids", "names")
+
+    def __init__(self):
+        self.ids = {}
+        self.names = []
+
+    def intern(self, name):
+        idx = self.ids.get(name)
+        if idx is None:
+            idx = len(self.names)
+            self.ids[name] = idx
+            self.names.append(name)
+        return idx
+
+    def lookup(self, name):
+        return self.ids.get(name)
+
+    def __len__(self):
+        return len(self.names)
+
+
+class CustomerStore:
+    """
+    Compact per-customer analytics, built in one pass over transactions
+
+    - Customer and product IDs are interned to dense ints
+    - total_spent (integer paise) / purchase_count live in flat arrays
+      indexed by customer
+    - Products bought per customer are kept as a sorted array("I") of
+      product ints, so memory grows with what each customer bought,
+      not with catalog size
+    - An inverted index (product -> array("I") of customers) answers
+      "who bought X" without scanning every customer
+
+    No per-customer dict is created unless as_dict() is called.
+    """
+    __slots__ = ("customers", "products", "total_spent", "purchase_count",
+                 "customer_products", "product_customers")
+
+    def __init__(self):
+        self.customers = _Interner()
+        self.products = _Interner()
+        self.total_spent = array("q")
+        self.purchase_count = array("q")
+        self.customer_products = []
+        self.product_customers = []
+
+    def add(self, customer, product, amount):
+        # amount is in paise
+        cid = self.customers.intern(customer)
+        if cid == len(self.total_spent):
+            self.total_spent.append(0)
+            self.purchase_count.append(0)
+            self.customer_products.append(array("I"))
+
+        pid = self.products.intern(product)
+        if pid == len(self.product_customers):
+            self.product_customers.append(array("I"))
+
+        self.total_spent[cid] += amount
+        self.purchase_count[cid] += 1
+
+        bought = self.customer_products[cid]
+        pos = bisect_left(bought, pid)
+        if pos == len(bought) or bought[pos] != pid:
+            bought.insert(pos, pid)
+            self.product_customers[pid].append(cid)
+
+    def __len__(self):
+        return len(self.customers)
+
+    #-- a) Top Spenders
+    def top_spenders(self, n=5):
+        """
+        Returns [(customer_id, total_spent, purchase_count), ...] sorted by spend
+        total_spent is in rupees
+        """
+        best = nlargest(n, range(len(self.total_spent)), key=self.total_spent.__getitem__)
+        return [
+            (self.customers.names[i], paise_to_rupees(self.total_spent[i]), self.purchase_count[i])
+            for i in best
+        ]
+
+    #-- b) Customers Who Bought Product X
+    def customers_who_bought(self, product):
+        """
+        Returns list of customer IDs that bought the given product name
+        """
+        pid = self.products.lookup(product)
+        if pid is None:
+            return []
+
+        names = self.customers.names
+        return [names[i] for i in self.product_customers[pid]]
+
+    #-- c) Repeat Purchase Rate
+    def repeat_purchase_rate(self):
+        """
+        Percentage of customers with more than one purchase
+        """
+        total = len(self.purchase_count)
+        if not total:
+            return 0.0
+        repeat = sum(1 for c in self.purchase_count if c > 1)
+        return round(repeat / total * 100, 2)
+
+    def products_bought(self, customer):
+        """
+        Returns product names bought by one customer (in order of first
+        appearance in the data)
+        """
+        cid = self.customers.lookup(customer)
+        if cid is None:
+            return []
+
+        names = self.products.names
+        return [names[pid] for pid in self.customer_products[cid]]
+
+    def as_dict(self):
+        """
+        Materialises the same structure customer_analysis() returns
+        """
+        result = {}
+        order = sorted(range(len(self.total_spent)), key=self.total_spent.__getitem__, reverse=True)
+        for i in order:
+            name = self.customers.names[i]
+            total = paise_to_rupees(self.total_spent[i])
+            count = self.purchase_count[i]
+            result[name] = {
+                "total_spent": total,
+                "purchase_count": count,
+                "products_bought": self.products_bought(name),
+                "avg_order_value": round(total / count, 2),
+            }
+        return result
+
+
+def build_customer_store(transactions):
+    store = CustomerStore()
+    for txn in with_paise(transactions):
+        store.add(txn["CustomerID"], txn["ProductName"], txn["Quantity"] * txn["UnitPricePaise"])
+    return store
@@ -1,31 +1,75 @@
+from datetime import datetime
+
+from utils.customer_store import build_customer_store
+from utils.money import FAST_PAISE_LIMIT, paise_to_rupees, parse_paise, to_paise, with_paise
+
+
 ## ------------------------------ PART:1 ----------------------------- ##
 #-------- Task 1.2: Parse and Clean Data -------#
 
+# Distinct price strings remembered per parse_transactions() call
+PRICE_CACHE_SIZE = 4096
+
+
 def parse_transactions(raw_lines):
     transactions = []
     if not raw_lines:
         return transactions
 
     header = raw_lines[0].split("|")
+    n_fields = len(header)
+    append = transactions.append
+    # Raw price text -> (UnitPrice, UnitPricePaise); catalogs reuse a small
+    # set of prices, so most rows skip the float/paise conversion entirely
+    prices = {}
+    cached_price = prices.get
 
     for line in raw_lines[1:]:
         parts = line.split("|")
 
-        if len(parts) != len(header):
+        if len(parts) != n_fields:
             continue
 
         try:
+            # Exact paise value is what all aggregation uses. Inlined fast
+            # path of parse_paise(), reusing the float for UnitPrice.
+            # int()/float() ignore surrounding whitespace, so no strip().
+            price_text = parts[5]
+            cached = cached_price(price_text)
+            if cached is None:
+                if "," in price_text:
+                    price_text = price_text.replace(",", "")
+                price = float(price_text)
+                scaled = price * 100
+                if -FAST_PAISE_LIMIT < price < FAST_PAISE_LIMIT:
+                    price_paise = round(scaled)
+                    # Further than 0.25 from a whole paise: 3+ decimals or a
+                    # half-paise tie, which needs exact decimal rounding
+                    if not -0.25 < scaled - price_paise < 0.25:
+                        price_paise = parse_paise(price_text)
+                else:
+                    price_paise = parse_paise(price_text)
+                if len(prices) < PRICE_CACHE_SIZE:
+                    prices[parts[5]] = price, price_paise
+            else:
+                price, price_paise = cached
+
+            quantity = parts[4]
+            if "," in quantity:
+                quantity = quantity.replace(",", "")
+
             transaction = {
                 "TransactionID": parts[0].strip(),
                 "Date": parts[1].strip(),
                 "ProductID": parts[2].strip(),
                 "ProductName": parts[3].strip(),
-                "Quantity": int(parts[4].replace(",", "").strip()),
-                "UnitPrice": float(parts[5].replace(",", "").strip()),
+                "Quantity": int(quantity),
+                "UnitPrice": price,
+                "UnitPricePaise": price_paise,
                 "CustomerID": parts[6].strip(),
                 "Region": parts[7].strip(),
             }
-            transactions.append(transaction)
+            append(transaction)
 
         except ValueError:
             continue
@@ -46,7 +90,7 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
     invalid_count = 0
 
     for t in transactions:
-        if any(k not in t or str(t[k]).strip() == "" for k in required_fields):
+        if any(k not in t or t[k] is None or str(t[k]).strip() == "" for k in required_fields):
             invalid_count += 1
             continue
 
@@ -64,6 +108,10 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
             invalid_count += 1
             continue
 
+        # Only derive the paise price once the record is known to be valid
+        if "UnitPricePaise" not in t:
+            t = dict(t, UnitPricePaise=to_paise(t["UnitPrice"]))
+
         valid.append(t)
 
     filtered = valid
@@ -77,12 +125,14 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
 
     if min_amount is not None or max_amount is not None:
         before = len(filtered)
+        min_paise = to_paise(min_amount) if min_amount is not None else None
+        max_paise = to_paise(max_amount) if max_amount is not None else None
 
         def in_range(t):
-            amt = t["Quantity"] * t["UnitPrice"]
-            if min_amount is not None and amt < min_amount:
+            amt = t["Quantity"] * t["UnitPricePaise"]
+            if min_paise is not None and amt < min_paise:
                 return False
-            if max_amount is not None and amt > max_amount:
+            if max_paise is not None and amt > max_paise:
                 return False
             return True
 
@@ -101,37 +151,43 @@ def validate_and_filter(transactions, region=None, min_amount=None, max_amount=N
 
 
 ## ------------------------------ PART:2 ----------------------------- ##
+# Amounts are summed as integer paise (see utils/money.py) and converted
+# to rupees only in the returned results, so totals are exact.
+# Records without UnitPricePaise (only UnitPrice) are handled via with_paise().
+
 #-----------------Task 2.1: Sales Summary Calculation------------------#
 
 #-- a) Calculate Total Revenue
 def calculate_total_revenue(transactions):
-    total_revenue = 0.0
-    for txn in transactions:
-        total_revenue += txn["Quantity"] * txn["UnitPrice"]
-    return total_revenue
+    total_paise = 0
+    for txn in with_paise(transactions):
+        total_paise += txn["Quantity"] * txn["UnitPricePaise"]
+    return paise_to_rupees(total_paise)
 
 
 #-- b) Region-wise Sales Analysis
 def region_wise_sales(transactions):
     region_data = {}
-    overall_total = 0.0
+    overall_total = 0
 
-    for txn in transactions:
+    for txn in with_paise(transactions):
         region = txn["Region"]
-        amount = txn["Quantity"] * txn["UnitPrice"]
+        amount = txn["Quantity"] * txn["UnitPricePaise"]
         overall_total += amount
 
         if region not in region_data:
             region_data[region] = {
-                "total_sales": 0.0,
+                "total_sales_paise": 0,
                 "transaction_count": 0
             }
 
-        region_data[region]["total_sales"] += amount
+        region_data[region]["total_sales_paise"] += amount
         region_data[region]["transaction_count"] += 1
 
     for region in region_data:
-        pct = (region_data[region]["total_sales"] / overall_total * 100) if overall_total else 0
+        total = region_data[region]["total_sales_paise"]
+        region_data[region]["total_sales"] = paise_to_rupees(total)
+        pct = (total / overall_total * 100) if overall_total else 0
         region_data[region]["percentage"] = round(pct, 2)
 
     return dict(sorted(region_data.items(), key=lambda x: x[1]["total_sales"], reverse=True))
@@ -141,19 +197,19 @@ def region_wise_sales(transactions):
 def top_selling_products(transactions, n=5):
     product_data = {}
 
-    for txn in transactions:
+    for txn in with_paise(transactions):
         product = txn["ProductName"]
         quantity = txn["Quantity"]
-        revenue = txn["Quantity"] * txn["UnitPrice"]
+        revenue = txn["Quantity"] * txn["UnitPricePaise"]
 
         if product not in product_data:
-            product_data[product] = {"qty": 0, "rev": 0.0}
+            product_data[product] = {"qty": 0, "rev": 0}
 
         product_data[product]["qty"] += quantity
         product_data[product]["rev"] += revenue
 
     product_list = [
-        (product, data["qty"], round(data["rev"], 2))
+        (product, data["qty"], paise_to_rupees(data["rev"]))
         for product, data in product_data.items()
     ]
 
@@ -163,31 +219,9 @@ def top_selling_products(transactions, n=5):
 
 #-- d) Customer Purchase Analysis
 def customer_analysis(transactions):
-    customer_data = {}
-
-    for txn in transactions:
-        customer = txn["CustomerID"]
-        amount = txn["Quantity"] * txn["UnitPrice"]
-        product = txn["ProductName"]
-
-        if customer not in customer_data:
-            customer_data[customer] = {
-                "total_spent": 0.0,
-                "purchase_count": 0,
-                "products_bought": set()
-            }
-
-        customer_data[customer]["total_spent"] += amount
-        customer_data[customer]["purchase_count"] += 1
-        customer_data[customer]["products_bought"].add(product)
-
-    for customer in customer_data:
-        total = customer_data[customer]["total_spent"]
-        count = customer_data[customer]["purchase_count"]
-        customer_data[customer]["avg_order_value"] = round(total / count, 2)
-        customer_data[customer]["products_bought"] = list(customer_data[customer]["products_bought"])
-
-    return dict(sorted(customer_data.items(), key=lambda x: x[1]["total_spent"], reverse=True))
+    # Backed by the compact CustomerStore; only materialises the per-customer
+    # dicts for callers that still need them
+    return build_customer_store(transactions).as_dict()
 
 
 #--------------------- Task 2.2: Date-based Analysis ---------------------#
@@ -196,14 +230,14 @@ def customer_analysis(transactions):
 def daily_sales_trend(transactions):
     daily = {}
 
-    for txn in transactions:
+    for txn in with_paise(transactions):
         date = txn["Date"]
-        amount = txn["Quantity"] * txn["UnitPrice"]
+        amount = txn["Quantity"] * txn["UnitPricePaise"]
         customer = txn["CustomerID"]
 
         if date not in daily:
             daily[date] = {
-                "revenue": 0.0,
+                "revenue": 0,
                 "transaction_count": 0,
                 "customers": set()
             }
@@ -215,7 +249,7 @@ def daily_sales_trend(transactions):
     for date in daily:
         daily[date]["unique_customers"] = len(daily[date]["customers"])
         del daily[date]["customers"]
-        daily[date]["revenue"] = round(daily[date]["revenue"], 2)
+        daily[date]["revenue"] = paise_to_rupees(daily[date]["revenue"])
 
     return dict(sorted(daily.items(), key=lambda x: x[0]))
 
@@ -233,25 +267,72 @@ def peak_sales_day(daily_trends):
     }
 
 
+#-- c) Sales Trend by Period
+def _period_key(date, period):
+    if period == "year":
+        return date[:4]
+    if period == "month":
+        return date[:7]
+    if period == "week":
+        try:
+            year, week, _ = datetime.strptime(date, "%Y-%m-%d").isocalendar()
+            return f"{year}-W{week:02d}"
+        except ValueError:
+            return date
+    return date
+
+
+def sales_trend_by_period(transactions, period="day"):
+    """
+    Same as daily_sales_trend() but bucketed by "day", "week" (ISO), "month" or "year"
+    """
+    if period == "day":
+        return daily_sales_trend(transactions)
+
+    buckets = {}
+
+    for txn in with_paise(transactions):
+        key = _period_key(txn["Date"], period)
+        amount = txn["Quantity"] * txn["UnitPricePaise"]
+
+        if key not in buckets:
+            buckets[key] = {
+                "revenue": 0,
+                "transaction_count": 0,
+                "customers": set()
+            }
+
+        buckets[key]["revenue"] += amount
+        buckets[key]["transaction_count"] += 1
+        buckets[key]["customers"].add(txn["CustomerID"])
+
+    for key in buckets:
+        buckets[key]["unique_customers"] = len(buckets[key]["customers"])
+        del buckets[key]["customers"]
+        buckets[key]["revenue"] = paise_to_rupees(buckets[key]["revenue"])
+
+    return dict(sorted(buckets.items(), key=lambda x: x[0]))
+
+
 #--------------------- Task 2.3: Product Performance ---------------------#
 
 #-- a) Low Performing Products
 def low_performing_products(transactions, threshold=10):
     product_data = {}
 
-    for txn in transactions:
+    for txn in with_paise(transactions):
         product = txn["ProductName"]
         quantity = txn["Quantity"]
-        revenue = txn["Quantity"] * txn["UnitPrice"]
+        revenue = txn["Quantity"] * txn["UnitPricePaise"]
 
         if product not in product_data:
-            product_data[product] = {"qty": 0, "rev": 0.0}
+            product_data[product] = {"qty": 0, "rev": 0}
 
         product_data[product]["qty"] += quantity
         product_data[product]["rev"] += revenue
 
     low_products = [
-        (product, data["qty"], round(data["rev"], 2))
+        (product, data["qty"], paise_to_rupees(data["rev"]))
         for product, data in product_data.items()
         if data["qty"] < threshold
     ]
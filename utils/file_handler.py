@@ -1,12 +1,33 @@
 # utils/file_handler.py
 
+import glob
+import os
+import time
+
+
+SALES_HEADER = [
+    "TransactionID", "Date", "ProductID", "ProductName",
+    "Quantity", "UnitPrice", "CustomerID", "Region"
+]
+
+# Files picked up when a directory is given as input
+INPUT_PATTERNS = ("*.txt", "*.txt.gz")
+
+
+def _open_text(file_path):
+    if file_path.endswith(".gz"):
+        import gzip
+        return gzip.open(file_path, "rt", encoding="utf-8")
+    return open(file_path, "r", encoding="utf-8")
+
+
 def read_sales_data(file_path):
     """
-    Reads raw sales data from file
+    Reads raw sales data from file (plain or .gz)
     Returns list of raw lines
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
+        with _open_text(file_path) as file:
             lines = file.readlines()
 
         # Remove empty lines and strip newline characters
@@ -19,3 +40,136 @@ def read_sales_data(file_path):
     except Exception as e:
         print(f"Error reading file: {e}")
         return []
+
+
+def expand_input_paths(inputs, exclude=()):
+    """
+    Expands files, directories and glob patterns into a list of files
+
+    - directory -> all *.txt / *.txt.gz files inside it
+    - glob      -> matching files
+    - file      -> itself
+    Files in exclude (e.g. the run's own output files) are never picked up
+    by directory or glob expansion. Order is preserved; the same file
+    reached by different spellings (data vs ./data/x.txt, symlinks) is
+    kept once.
+    """
+    excluded = {os.path.abspath(p) for p in exclude}
+
+    def keep(p):
+        return os.path.isfile(p) and os.path.abspath(p) not in excluded
+
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = []
+            for pattern in INPUT_PATTERNS:
+                matches.extend(glob.glob(os.path.join(item, pattern)))
+            paths.extend(sorted(p for p in matches if keep(p)))
+        elif glob.has_magic(item):
+            paths.extend(sorted(p for p in glob.glob(item) if keep(p)))
+        elif os.path.isfile(item):
+            paths.append(item)
+        else:
+            print(f"File not found: {item}")
+
+    seen = set()
+    unique = []
+    for p in paths:
+        real = os.path.realpath(p)
+        if real not in seen:
+            seen.add(real)
+            unique.append(p)
+    return unique
+
+
+def check_header(header_line):
+    """
+    True if the header line matches SALES_HEADER
+    """
+    return [h.strip() for h in header_line.split("|")] == SALES_HEADER
+
+
+def _process_file(file_path):
+    """
+    Reads, checks and parses one file (runs inside a worker)
+    """
+    from utils.data_processor import parse_transactions
+
+    start = time.perf_counter()
+    result = {"path": file_path, "transactions": [], "lines": 0, "error": None}
+
+    raw_lines = read_sales_data(file_path)
+    result["lines"] = len(raw_lines)
+
+    if not raw_lines:
+        result["error"] = "no data"
+    elif not check_header(raw_lines[0]):
+        result["error"] = "header does not match schema"
+    else:
+        result["transactions"] = parse_transactions(raw_lines)
+
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def read_sales_files(file_paths, workers=None):
+    """
+    Reads and parses many sales files, in parallel across a process pool
+
+    Files are read in-process when only one worker would run (one file,
+    workers=1, or a single CPU): shipping records back from a pool costs
+    more than parsing them.
+
+    Returns (transactions, file_stats)
+    - transactions: all parsed records merged in input file order
+    - file_stats: per-file dicts with path, lines, records, seconds, error
+    """
+    results = [None] * len(file_paths)
+    total = len(file_paths)
+    done = 0
+
+    def report(result):
+        secs = result["seconds"]
+        rate = (result["lines"] / secs) if secs else 0.0
+        if result["error"]:
+            status = f"skipped ({result['error']})"
+        else:
+            status = f"{result['lines']} lines, {len(result['transactions'])} records in {secs:.2f}s ({rate:,.0f} lines/s)"
+        print(f"  [{done}/{total}] {result['path']}: {status}")
+
+    pool_size = min(workers or os.cpu_count() or 1, total)
+
+    if pool_size <= 1:
+        for i, path in enumerate(file_paths):
+            results[i] = _process_file(path)
+            done += 1
+            report(results[i])
+    else:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=pool_size) as pool:
+            futures = {pool.submit(_process_file, path): i for i, path in enumerate(file_paths)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    results[i] = {"path": file_paths[i], "transactions": [], "lines": 0,
+                                  "seconds": 0.0, "error": str(e)}
+                done += 1
+                report(results[i])
+
+    transactions = []
+    file_stats = []
+    for r in results:
+        transactions.extend(r["transactions"])
+        file_stats.append({
+            "path": r["path"],
+            "lines": r["lines"],
+            "records": len(r["transactions"]),
+            "seconds": r["seconds"],
+            "error": r["error"],
+        })
+
+    return transactions, file_stats
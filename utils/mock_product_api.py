@@ -0,0 +1,197 @@
+#------------------------ Mock Product API Server ------------------------#
+#
+# Local stand-in for the DummyJSON products API, for offline runs and
+# load-testing the enrichment path. Serves:
+#   GET /products?limit=&skip=   -> {"products": [...], "total", "skip", "limit"}
+#   GET /products/{id}           -> single product, 404 if unknown
+#
+# Usage:
+#   python -m utils.mock_product_api --port 8000 --catalog-size 1000 \
+#       --latency 0.05 --error-rate 0.1 --rate-limit 20
+#   SALES_API_BASE_URL=http://127.0.0.1:8000/products python main.py
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+CATEGORIES = ["smartphones", "laptops", "accessories", "audio", "monitors", "peripherals"]
+BRANDS = ["Apple", "Samsung", "Dell", "HP", "Logitech", "Sony", "Lenovo", "Asus"]
+
+
+def make_catalog(size, seed=42):
+    """
+    Deterministic DummyJSON-shaped product list with ids 1..size
+    """
+    rng = random.Random(seed)
+    return [
+        {
+            "id": i,
+            "title": f"Product {i}",
+            "category": rng.choice(CATEGORIES),
+            "brand": rng.choice(BRANDS),
+            "price": round(rng.uniform(5, 2000), 2),
+            "rating": round(rng.uniform(1, 5), 2),
+        }
+        for i in range(1, size + 1)
+    ]
+
+
+class _RateLimiter:
+    """
+    Token bucket allowing `rate` requests per second (None = unlimited)
+    Holds at least one token so rates below 1/s still let requests through
+    """
+    def __init__(self, rate):
+        self.rate = rate
+        self.capacity = max(1, rate or 0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def allow(self):
+        if not self.rate:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+
+class MockProductServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, catalog_size=200, latency=0.0, error_rate=0.0, rate_limit=None, seed=42):
+        super().__init__(address, _ProductHandler)
+        self.catalog = make_catalog(catalog_size, seed=seed)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.limiter = _RateLimiter(rate_limit)
+        self.rng = random.Random(seed)
+        self.stats = {"requests": 0, "errors": 0, "rate_limited": 0}
+        self.stats_lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/products"
+
+    def count(self, key):
+        with self.stats_lock:
+            self.stats[key] += 1
+
+
+class _ProductHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, body, headers=None):
+        raw = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_GET(self):
+        server = self.server
+        server.count("requests")
+
+        if not server.limiter.allow():
+            server.count("rate_limited")
+            self._send_json(429, {"message": "Too Many Requests"}, {"Retry-After": "1"})
+            return
+
+        if server.latency:
+            time.sleep(server.latency)
+
+        if server.error_rate and server.rng.random() < server.error_rate:
+            server.count("errors")
+            self._send_json(500, {"message": "Internal Server Error"})
+            return
+
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split("/") if p]
+
+        if parts == ["products"]:
+            query = parse_qs(url.query)
+            try:
+                limit = int(query.get("limit", ["30"])[0])
+                skip = int(query.get("skip", ["0"])[0])
+            except ValueError:
+                self._send_json(400, {"message": "Invalid limit/skip"})
+                return
+
+            total = len(server.catalog)
+            # DummyJSON treats limit=0 as "everything"
+            end = total if limit == 0 else skip + limit
+            page = server.catalog[skip:end]
+            self._send_json(200, {"products": page, "total": total, "skip": skip, "limit": len(page)})
+            return
+
+        if len(parts) == 2 and parts[0] == "products":
+            try:
+                pid = int(parts[1])
+            except ValueError:
+                pid = None
+            if pid is not None and 1 <= pid <= len(server.catalog):
+                self._send_json(200, server.catalog[pid - 1])
+            else:
+                self._send_json(404, {"message": f"Product with id '{parts[1]}' not found"})
+            return
+
+        self._send_json(404, {"message": "Not found"})
+
+
+def start_mock_server(host="127.0.0.1", port=0, **options):
+    """
+    Starts the mock server in a background thread
+    Returns the server; use server.base_url and server.shutdown()
+    """
+    server = MockProductServer((host, port), **options)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock DummyJSON product API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--catalog-size", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--rate-limit", type=float, help="Max requests per second before 429")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    server = MockProductServer(
+        (args.host, args.port),
+        catalog_size=args.catalog_size,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+    )
+    print(f"Mock product API serving {args.catalog_size} products at {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# utils/money.py
+
+#------------------------- Fixed-point Money -------------------------#
+#
+# Revenue is carried as integer paise (1 rupee = 100 paise) through
+# parsing, aggregation and merging. Integer sums are exact and do not
+# depend on summation order, so totals match across runs, files and
+# parallel workers. Convert to rupees only for display/output.
+
+from decimal import Decimal, ROUND_HALF_UP
+
+
+# Below this many rupees, price * 100 as a float is within 0.25 of the
+# exact decimal value, so it can be rounded to paise without Decimal
+FAST_PAISE_LIMIT = 1e13
+
+
+def parse_paise(text):
+    """
+    Parses a price string into integer paise exactly
+
+    "1,916"   -> 191600
+    "523.5"   -> 52350
+    "99.999"  -> 10000  (more than 2 decimals: rounded half-up)
+    Raises ValueError on invalid input.
+    """
+    s = text.replace(",", "").strip()
+
+    # Fast path: within 0.25 of a whole paise after scaling the float,
+    # so rounding matches exact half-up rounding of the decimal string
+    try:
+        value = float(s)
+    except ValueError:
+        raise ValueError(f"invalid price: {text!r}")
+    if -FAST_PAISE_LIMIT < value < FAST_PAISE_LIMIT:
+        scaled = value * 100
+        paise = round(scaled)
+        if -0.25 < scaled - paise < 0.25:
+            return paise
+
+    # Everything else (3+ decimals, huge values, nan/inf): exact decimal rounding
+    try:
+        value = Decimal(s).scaleb(2)
+    except ArithmeticError:
+        raise ValueError(f"invalid price: {text!r}")
+    if not value.is_finite():
+        raise ValueError(f"invalid price: {text!r}")
+    return int(value.to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def to_paise(amount):
+    """
+    Converts a rupee amount (int/float) to integer paise
+    """
+    return int(Decimal(str(amount)).scaleb(2).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def paise_to_rupees(paise):
+    return paise / 100
+
+
+def with_paise(transactions):
+    """
+    Yields transactions that all carry UnitPricePaise
+
+    Records from parse_transactions() pass through untouched; records built
+    elsewhere (only UnitPrice) get a copy with the paise price derived once.
+    """
+    for txn in transactions:
+        if "UnitPricePaise" not in txn:
+            txn = dict(txn, UnitPricePaise=to_paise(txn["UnitPrice"]))
+        yield txn
@@ -1,79 +1,127 @@
 import os
-from datetime import datetime
+from collections import Counter
+from itertools import islice
 
- # 1)HEADER
-from utils.data_processor import (
-    calculate_total_revenue,
-    region_wise_sales,
-    top_selling_products,
-    customer_analysis,
-    daily_sales_trend,
-    low_performing_products,
-)
+# Section caps keep report size bounded regardless of data volume.
+# Full detail goes to the optional appendix files instead.
+MAX_TREND_ROWS = 60
+MAX_FAILED_PRODUCTS = 20
+MAX_LOW_PRODUCTS = 20
+
+TREND_PERIODS = ("day", "week", "month", "year")
 
 def format_inr(amount: float) -> str:
     return f"₹{amount:,.2f}"
 
-def generate_sales_report(transactions, enriched_transactions, output_file="output/sales_report.txt"):
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+def write_rows(f, rows, max_rows=None):
+    """
+    Streams formatted rows from an iterator to f
+    Stops after max_rows and returns how many rows were left out
+    """
+    written = 0
+    skipped = 0
+    for row in rows:
+        if max_rows is not None and written >= max_rows:
+            skipped += 1
+            continue
+        f.write(row + "\n")
+        written += 1
+    return skipped
 
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    total_records = len(transactions)
+def _trend_rows(trend):
+    for d, info in trend.items():
+        rev = float(info.get("revenue", 0))
+        cnt = int(info.get("transaction_count", 0))
+        uniq = int(info.get("unique_customers", 0))
+        yield f"{d:<12}{format_inr(rev):>15}{cnt:>14}{uniq:>18}"
 
- # 2) OVERALL SUMMARY
-    total_revenue = calculate_total_revenue(transactions)
-    total_txn = len(transactions)
-    avg_order_value = (total_revenue / total_txn) if total_txn else 0.0
+def _low_perf_rows(low_perf):
+    for pname, qty, rev in low_perf:
+        yield f"{str(pname)[:22]:<22}{int(qty):>10}{format_inr(float(rev)):>15}"
 
-    dates = sorted([t.get("Date") for t in transactions if t.get("Date")])
-    date_range = f"{dates[0]} to {dates[-1]}" if dates else "N/A"
+def _failed_rows(failed_counts, n=None):
+    for item, cnt in failed_counts.most_common(n):
+        yield f"- {item}: {cnt} transaction(s)"
 
- # 3) REGION-WISE PERFORMANCE
-    region_stats = region_wise_sales(transactions)
+def _choose_trend_period(transactions, daily_trend, period, max_rows):
+    """
+    "auto" keeps daily rows while they fit in max_rows,
+    otherwise falls back to weekly, monthly, then yearly buckets
+    """
+    from utils.data_processor import sales_trend_by_period
 
- # 4) TOP 5 PRODUCTS
-    top5_products = top_selling_products(transactions, n=5)
+    if period != "auto":
+        return period, (daily_trend if period == "day" else sales_trend_by_period(transactions, period))
 
- # 5) TOP 5 CUSTOMERS
-    customers = customer_analysis(transactions)
-    top5_customers = list(customers.items())[:5]
+    if max_rows is None or len(daily_trend) <= max_rows:
+        return "day", daily_trend
 
-  # 6) DAILY SALES TREND
-    trend = daily_sales_trend(transactions)
+    for candidate in TREND_PERIODS[1:]:
+        bucketed = sales_trend_by_period(transactions, candidate)
+        if len(bucketed) <= max_rows:
+            break
+    return candidate, bucketed
 
- # 7) PRODUCT PERFORMANCE ANALYSIS
-    best_day = None
-    best_day_rev = -1
-    for d, info in trend.items():
-        rev = float(info.get("revenue", 0))
-        if rev > best_day_rev:
-            best_day_rev = rev
-            best_day = d
+def write_appendix(appendix_dir, daily_trend, low_perf, failed_counts):
+    """
+    Writes full-detail appendix files (every day, every low performing
+    product, every failed product)
+    Returns list of written paths
+    """
+    os.makedirs(appendix_dir, exist_ok=True)
 
-    low_perf = low_performing_products(transactions, threshold=10)
+    trend_path = os.path.join(appendix_dir, "daily_sales_trend.txt")
+    with open(trend_path, "w", encoding="utf-8") as f:
+        f.write(f"{'Date':<12}{'Revenue':>15}{'Transactions':>14}{'Unique Customers':>18}\n")
+        write_rows(f, _trend_rows(daily_trend))
 
-    avg_by_region = {}
-    for region, info in region_stats.items():
-        sales = float(info.get("total_sales", 0))
-        cnt = int(info.get("transaction_count", 0))
-        avg_by_region[region] = (sales / cnt) if cnt else 0.0
+    low_path = os.path.join(appendix_dir, "low_performing_products.txt")
+    with open(low_path, "w", encoding="utf-8") as f:
+        f.write(f"{'Product Name':<22}{'Qty Sold':>10}{'Revenue':>15}\n")
+        write_rows(f, _low_perf_rows(low_perf))
 
- # 8) API ENRICHMENT SUMMARY
-    enriched_count = 0
-    failed_products = set()
-
-    for t in enriched_transactions:
-        if t.get("API_Match") is True:
-            enriched_count += 1
+    failed_path = os.path.join(appendix_dir, "failed_products.txt")
+    with open(failed_path, "w", encoding="utf-8") as f:
+        f.write("Products that couldn't be enriched:\n")
+        if failed_counts:
+            write_rows(f, _failed_rows(failed_counts))
         else:
-            pid = t.get("ProductID", "")
-            pname = t.get("ProductName", "")
-            failed_products.add(f"{pid} ({pname})".strip())
+            f.write("None\n")
 
-    total_checked = len(enriched_transactions)
-    success_rate = (enriched_count / total_checked * 100) if total_checked else 0.0
+    return [trend_path, low_path, failed_path]
+
+def generate_sales_report(transactions, enriched_transactions, output_file="output/sales_report.txt",
+                          trend_period="auto", max_trend_rows=MAX_TREND_ROWS,
+                          max_failed_products=MAX_FAILED_PRODUCTS, max_low_products=MAX_LOW_PRODUCTS,
+                          appendix_dir=None):
+    """
+    Writes the report section by section straight to output_file
+
+    - trend_period: "auto", "day", "week", "month" or "year"
+    - max_trend_rows / max_low_products / max_failed_products: per-section
+      row caps (None = no cap); the trend keeps the most recent rows
+    - appendix_dir: if set, full daily trend, low performing and failed
+      product lists are written there as separate files
+
+    Returns list of written paths: the report first, then any appendix files
+    """
+    # Analysis functions are imported here so importing this module stays cheap
+    from utils.data_processor import (
+        calculate_total_revenue,
+        region_wise_sales,
+        top_selling_products,
+        daily_sales_trend,
+        low_performing_products,
+    )
+    from utils.customer_store import build_customer_store
+    from datetime import datetime
+
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+
+ # 1)HEADER
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    total_records = len(transactions)
 
-# WRITE REPORT
     with open(output_file, "w", encoding="utf-8") as f:
         f.write("=" * 55 + "\n")
         f.write("SALES ANALYTICS REPORT".center(55) + "\n")
@@ -81,6 +129,15 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
         f.write(f"Records Processed: {total_records}".center(55) + "\n")
         f.write("=" * 55 + "\n\n")
 
+ # 2) OVERALL SUMMARY
+        total_revenue = calculate_total_revenue(transactions)
+        total_txn = len(transactions)
+        avg_order_value = (total_revenue / total_txn) if total_txn else 0.0
+
+        first_date = min((t.get("Date") for t in transactions if t.get("Date")), default=None)
+        last_date = max((t.get("Date") for t in transactions if t.get("Date")), default=None)
+        date_range = f"{first_date} to {last_date}" if first_date else "N/A"
+
         f.write("OVERALL SUMMARY\n")
         f.write("-" * 55 + "\n")
         f.write(f"Total Revenue:         {format_inr(total_revenue)}\n")
@@ -88,6 +145,9 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
         f.write(f"Average Order Value:   {format_inr(avg_order_value)}\n")
         f.write(f"Date Range:            {date_range}\n\n")
 
+ # 3) REGION-WISE PERFORMANCE
+        region_stats = region_wise_sales(transactions)
+
         f.write("REGION-WISE PERFORMANCE\n")
         f.write("-" * 55 + "\n")
         f.write(f"{'Region':<10}{'Sales':>15}{'% of Total':>12}{'Transactions':>14}\n")
@@ -98,6 +158,9 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
             f.write(f"{region:<10}{format_inr(sales):>15}{pct:>12.2f}{cnt:>14}\n")
         f.write("\n")
 
+ # 4) TOP 5 PRODUCTS
+        top5_products = top_selling_products(transactions, n=5)
+
         f.write("TOP 5 PRODUCTS\n")
         f.write("-" * 55 + "\n")
         f.write(f"{'Rank':<6}{'Product Name':<22}{'Qty Sold':>10}{'Revenue':>15}\n")
@@ -105,24 +168,50 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
             f.write(f"{i:<6}{str(pname)[:22]:<22}{int(qty):>10}{format_inr(float(rev)):>15}\n")
         f.write("\n")
 
+ # 5) TOP 5 CUSTOMERS
+        customers = build_customer_store(transactions)
+        top5_customers = customers.top_spenders(n=5)
+
         f.write("TOP 5 CUSTOMERS\n")
         f.write("-" * 55 + "\n")
         f.write(f"{'Rank':<6}{'Customer ID':<15}{'Total Spent':>15}{'Order Count':>14}\n")
-        for i, (cid, info) in enumerate(top5_customers, start=1):
-            spent = float(info.get("total_spent", 0))
-            cnt = int(info.get("purchase_count", 0))
+        for i, (cid, spent, cnt) in enumerate(top5_customers, start=1):
             f.write(f"{i:<6}{cid:<15}{format_inr(spent):>15}{cnt:>14}\n")
         f.write("\n")
 
-        f.write("DAILY SALES TREND\n")
+  # 6) DAILY SALES TREND
+        trend = daily_sales_trend(transactions)
+        period, period_trend = _choose_trend_period(transactions, trend, trend_period, max_trend_rows)
+        label = {"day": "Date", "week": "Week", "month": "Month", "year": "Year"}.get(period, "Date")
+
+        f.write("DAILY SALES TREND" if period == "day" else f"SALES TREND (by {period})")
+        f.write("\n")
         f.write("-" * 55 + "\n")
-        f.write(f"{'Date':<12}{'Revenue':>15}{'Transactions':>14}{'Unique Customers':>18}\n")
+        f.write(f"{label:<12}{'Revenue':>15}{'Transactions':>14}{'Unique Customers':>18}\n")
+        # Over the cap, show the most recent periods
+        skipped = 0
+        if max_trend_rows is not None and len(period_trend) > max_trend_rows:
+            skipped = len(period_trend) - max_trend_rows
+            f.write(f"... {skipped} earlier row(s) not shown\n")
+        write_rows(f, islice(_trend_rows(period_trend), skipped, None))
+        f.write("\n")
+
+ # 7) PRODUCT PERFORMANCE ANALYSIS
+        best_day = None
+        best_day_rev = -1
         for d, info in trend.items():
             rev = float(info.get("revenue", 0))
+            if rev > best_day_rev:
+                best_day_rev = rev
+                best_day = d
+
+        low_perf = low_performing_products(transactions, threshold=10)
+
+        avg_by_region = {}
+        for region, info in region_stats.items():
+            sales = float(info.get("total_sales", 0))
             cnt = int(info.get("transaction_count", 0))
-            uniq = int(info.get("unique_customers", 0))
-            f.write(f"{d:<12}{format_inr(rev):>15}{cnt:>14}{uniq:>18}\n")
-        f.write("\n")
+            avg_by_region[region] = (sales / cnt) if cnt else 0.0
 
         f.write("PRODUCT PERFORMANCE ANALYSIS\n")
         f.write("-" * 55 + "\n")
@@ -131,8 +220,9 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
         f.write("Low Performing Products (Qty < threshold)\n")
         if low_perf:
             f.write(f"{'Product Name':<22}{'Qty Sold':>10}{'Revenue':>15}\n")
-            for pname, qty, rev in low_perf:
-                f.write(f"{str(pname)[:22]:<22}{int(qty):>10}{format_inr(float(rev)):>15}\n")
+            skipped = write_rows(f, _low_perf_rows(low_perf), max_rows=max_low_products)
+            if skipped:
+                f.write(f"... {skipped} more product(s) not shown\n")
         else:
             f.write("None\n")
         f.write("\n")
@@ -143,6 +233,23 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
             f.write(f"{region:<10}{format_inr(avgv):>15}\n")
         f.write("\n")
 
+ # 8) API ENRICHMENT SUMMARY
+        enriched_count = 0
+        failed_counts = Counter()
+
+        for t in enriched_transactions:
+            if t.get("API_Match") is True:
+                enriched_count += 1
+            else:
+                pid = t.get("ProductID", "")
+                pname = t.get("ProductName", "")
+                item = f"{pid} ({pname})".strip()
+                if item:
+                    failed_counts[item] += 1
+
+        total_checked = len(enriched_transactions)
+        success_rate = (enriched_count / total_checked * 100) if total_checked else 0.0
+
         f.write("API ENRICHMENT SUMMARY\n")
         f.write("-" * 55 + "\n")
         f.write(f"Total Transactions Checked: {total_checked}\n")
@@ -150,11 +257,16 @@ def generate_sales_report(transactions, enriched_transactions, output_file="outp
         f.write(f"Success Rate:              {success_rate:.2f}%\n\n")
 
         f.write("Products that couldn't be enriched:\n")
-        failed_list = sorted([x for x in failed_products if x])
-        if failed_list:
-            for item in failed_list:
-                f.write(f"- {item}\n")
+        if failed_counts:
+            write_rows(f, _failed_rows(failed_counts, max_failed_products))
+            if max_failed_products is not None and len(failed_counts) > max_failed_products:
+                more = len(failed_counts) - max_failed_products
+                f.write(f"... {more} more product(s) not shown\n")
         else:
             f.write("None\n")
 
-    return output_file
\ No newline at end of file
+    written = [output_file]
+    if appendix_dir:
+        written += write_appendix(appendix_dir, trend, low_perf, failed_counts)
+
+    return written
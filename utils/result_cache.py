@@ -0,0 +1,208 @@
+# utils/result_cache.py
+
+#------------------------- Result Cache -------------------------#
+#
+# Content-addressed cache of pipeline results. The key combines:
+# - input file fingerprints (path + size + mtime, or content hash)
+# - filter parameters passed to validate_and_filter()
+# - report options (trend bucketing, appendix directory)
+# - product catalog source (API base URL)
+# - code version (hash of the pipeline source files)
+#
+# Each entry is one JSON file holding the aggregate results, the
+# rendered output files and a fingerprint of the product catalog they
+# were built from. Once an entry is older than CATALOG_TTL seconds the
+# caller must re-fetch the catalog and only reuse the entry if the
+# fingerprint still matches (see catalog_is_fresh / catalog_version).
+#
+# Entries are evicted least-recently-used first once the cache grows
+# past CACHE_MAX_BYTES.
+
+import glob
+import hashlib
+import json
+import os
+import time
+
+
+CACHE_DIR = os.environ.get("SALES_CACHE_DIR", ".cache/results")
+CACHE_MAX_BYTES = int(os.environ.get("SALES_CACHE_MAX_BYTES", 50 * 1024 * 1024))
+CATALOG_TTL = int(os.environ.get("SALES_CATALOG_TTL", 3600))
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_CODE_FILES = ["main.py", "utils/*.py"]
+
+
+def code_version():
+    """
+    Hash of the pipeline source files, so any code change invalidates the cache
+    """
+    digest = hashlib.sha256()
+    for pattern in _CODE_FILES:
+        for path in sorted(glob.glob(os.path.join(_PROJECT_ROOT, pattern))):
+            with open(path, "rb") as f:
+                digest.update(os.path.relpath(path, _PROJECT_ROOT).encode())
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def file_fingerprint(file_path, use_hash=False):
+    """
+    Fingerprint of one input file
+
+    Default is path + size + mtime (no read needed).
+    use_hash=True hashes the full content instead.
+    """
+    if use_hash:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    st = os.stat(file_path)
+    return f"{os.path.abspath(file_path)}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def catalog_version(products):
+    """
+    Fingerprint of a fetched product catalog (ids and the fields used for enrichment)
+    """
+    digest = hashlib.sha256()
+    rows = sorted(
+        (p.get("id"), p.get("title"), p.get("category"), p.get("brand"), p.get("rating"))
+        for p in products
+        if isinstance(p.get("id"), int)
+    )
+    digest.update(json.dumps(rows).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def catalog_is_fresh(entry, ttl=CATALOG_TTL):
+    """
+    True if the entry's catalog was fetched (or re-checked) within ttl seconds
+    """
+    return time.time() - entry.get("catalog_fetched_at", 0) <= ttl
+
+
+def make_cache_key(input_paths, region=None, min_amount=None, max_amount=None,
+                   options=None, catalog_source=None, use_hash=False):
+    """
+    Builds the cache key for one run over one or more input files
+    """
+    if isinstance(input_paths, str):
+        input_paths = [input_paths]
+
+    payload = {
+        "inputs": [file_fingerprint(p, use_hash=use_hash) for p in input_paths],
+        "filters": {"region": region, "min_amount": min_amount, "max_amount": max_amount},
+        "options": options or {},
+        "catalog_source": catalog_source,
+        "code_version": code_version(),
+    }
+    raw = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _entry_path(key, cache_dir):
+    return os.path.join(cache_dir, f"{key}.json")
+
+
+def load_cached_result(key, cache_dir=CACHE_DIR):
+    """
+    Returns cached result dict or None on miss
+    A hit refreshes the entry's mtime (used for LRU order)
+    """
+    path = _entry_path(key, cache_dir)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            result = json.load(f)
+        os.utime(path, None)
+        return result
+
+    except FileNotFoundError:
+        return None
+
+    except (ValueError, OSError) as e:
+        print(f"Ignoring unreadable cache entry {path}: {e}")
+        return None
+
+
+def save_cached_result(key, result, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+    """
+    Stores result under key, then evicts old entries past max_bytes
+    """
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        path = _entry_path(key, cache_dir)
+        tmp_path = f"{path}.tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(result, f)
+        os.replace(tmp_path, path)
+
+        _evict(cache_dir, max_bytes)
+
+    except Exception as e:
+        print(f"Error saving result cache: {e}")
+
+
+def _list_entries(cache_dir):
+    entries = []
+    for path in glob.glob(os.path.join(cache_dir, "*.json")):
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    return entries
+
+
+def _evict(cache_dir, max_bytes):
+    entries = sorted(_list_entries(cache_dir))
+    total = sum(size for _, size, _ in entries)
+
+    # Oldest (least recently used) first
+    for _, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
+
+
+def cache_info(cache_dir=CACHE_DIR):
+    """
+    Summary of cache contents (most recently used first)
+    """
+    entries = sorted(_list_entries(cache_dir), reverse=True)
+    return {
+        "cache_dir": cache_dir,
+        "entries": len(entries),
+        "total_bytes": sum(size for _, size, _ in entries),
+        "max_bytes": CACHE_MAX_BYTES,
+        "items": [
+            {
+                "key": os.path.basename(path)[:-len(".json")],
+                "size": size,
+                "last_used": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(mtime)),
+            }
+            for mtime, size, path in entries
+        ],
+    }
+
+
+def clear_cache(cache_dir=CACHE_DIR):
+    """
+    Removes all cache entries, returns number removed
+    """
+    removed = 0
+    for _, _, path in _list_entries(cache_dir):
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            pass
+    return removed